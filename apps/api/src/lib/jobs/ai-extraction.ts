@@ -4,6 +4,36 @@ import Together from 'together-ai';
 import type { AIExtractedJob } from './types';
 import { trackAIUsage, estimateTokens, checkQuotaLimits } from '../ai-tracking';
 
+// Raw HTML considered for cleanup; the cleaned result is trimmed to 15k later
+const MAX_RAW_HTML_CHARS = 500_000;
+const MAX_CLEANED_HTML_CHARS = 15_000; // ~15k chars of AI context
+
+const BODY_OPEN_RE = /<body[\s>]/i;
+// <script>/<style> elements and HTML comments, stripped in a single pass
+const NOISE_RE = /<(script|style)\b[^<]*(?:(?!<\/\1>)<[^<]*)*<\/\1>|<!--[\s\S]*?-->/gi;
+const WHITESPACE_RE = /\s+/g;
+// First element whose class/id looks like a job listing container
+const JOB_BLOCK_RE = /<[a-z][^>]*\b(?:class|id)="[^"]*(?:job|vaga|oferta|offer|listing)/i;
+const JSON_ARRAY_RE = /\[[\s\S]*\]/;
+
+/**
+ * Cut cleaned HTML down to the AI context budget. The window starts at the
+ * first job-like container (skipping header/nav markup that would otherwise
+ * eat the budget), pulled back when needed so it always stays full, and ends
+ * before any tag left half-open by the cut.
+ */
+export function trimForContext(cleaned: string): string {
+  if (cleaned.length <= MAX_CLEANED_HTML_CHARS) return cleaned;
+
+  // search() returns -1 when nothing matches, which clamps to 0
+  const jobStart = cleaned.search(JOB_BLOCK_RE);
+  const start = Math.max(0, Math.min(jobStart, cleaned.length - MAX_CLEANED_HTML_CHARS));
+  const chunk = cleaned.slice(start, start + MAX_CLEANED_HTML_CHARS);
+
+  const lastOpen = chunk.lastIndexOf('<');
+  return lastOpen > chunk.lastIndexOf('>') ? chunk.slice(0, lastOpen) : chunk;
+}
+
 // Store last extraction details for debugging
 let lastExtractionDebug: {
   siteName: string;
@@ -63,13 +93,17 @@ export async function extractJobsWithAI(
       return [];
     }
 
+    // Job cards only live in <body>; skipping <head> (meta tags, preloads, inline
+    // config) keeps it out of both the cleanup passes and the AI context budget.
+    // Cap the raw body too: the AI only ever sees ~15k cleaned chars, and some
+    // boards return multi-MB pages that would otherwise go through every regex pass.
+    const bodyStart = Math.max(html.search(BODY_OPEN_RE), 0);
+    const bodyHtml = html.slice(bodyStart, bodyStart + MAX_RAW_HTML_CHARS);
+
     // Clean HTML - remove scripts, styles, and excessive whitespace
-    const cleanedHtml = html
-      .replace(/<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi, '')
-      .replace(/<style\b[^<]*(?:(?!<\/style>)<[^<]*)*<\/style>/gi, '')
-      .replace(/<!--[\s\S]*?-->/g, '')
-      .replace(/\s+/g, ' ')
-      .slice(0, 15000); // Limit to ~15k chars for AI context
+    const cleanedHtml = trimForContext(
+      bodyHtml.replace(NOISE_RE, '').replace(WHITESPACE_RE, ' ')
+    );
 
     const prompt = `You are a job listing extractor. Analyze this HTML from ${siteName} and extract job listings.
 
@@ -123,7 +157,7 @@ Respond with ONLY the JSON array.`;
     };
 
     // Extract JSON array from response
-    const jsonMatch = content.match(/\[[\s\S]*\]/);
+    const jsonMatch = content.match(JSON_ARRAY_RE);
     if (!jsonMatch) {
       console.log('AI extraction: No JSON array found in response');
       console.log('AI extraction: Raw response (first 500 chars):', content.slice(0, 500));
@@ -12,12 +12,19 @@
 
 import type { JobListing, JobSearchParams } from '../types';
 import { cleanHtmlText } from '../helpers';
+import { logger } from '../../logger';
 
 const BASE_URL = 'https://www.buscojobs.pt';
 // ts1017 = "Tecnologia da informação" category (server-side filtered to tech)
 const IT_CATEGORY_PATH = '/vagas/ts1017/trabalho-de-tecnologia-da-informacao';
 const MAX_PAGES = 5; // ~15 offers/page
 
+// The category pages are the same for every keyword (filtering happens here),
+// so cache each page's parsed offers by URL. `next: { revalidate }` is a no-op
+// outside Next.js, so without this every search re-fetched all pages.
+const PAGE_TTL = 5 * 60 * 1000; // 5 minutes
+const pageCache = new Map<string, { offers: BuscoJobsOffer[]; expiresAt: number }>();
+
 interface BuscoJobsOffer {
   IdOferta: number;
   CargoVacante: string;
@@ -40,8 +47,20 @@ export async function searchBuscoJobs(params: JobSearchParams): Promise<JobListi
         : `${BASE_URL}${IT_CATEGORY_PATH}/${i + 1}`
     );
 
-    const pages = await Promise.all(pageUrls.map(fetchOffers));
-    const offers = pages.flat();
+    // Fetch all category pages concurrently; a failed page only drops its own
+    // offers instead of discarding the pages that did load.
+    const pages = await Promise.allSettled(pageUrls.map(fetchOffers));
+    pages.forEach((p, i) => {
+      if (p.status === 'rejected') {
+        const message = p.reason instanceof Error ? p.reason.message : String(p.reason);
+        logger.warn('buscojobs', `Page fetch failed: ${pageUrls[i]}`, { error: message });
+      }
+    });
+    const offers = pages.flatMap((p) => (p.status === 'fulfilled' ? p.value : []));
+    if (offers.length === 0) {
+      const failed = pages.find((p): p is PromiseRejectedResult => p.status === 'rejected');
+      if (failed) throw failed.reason;
+    }
 
     // Deduplicate by offer id across pages
     const byId = new Map<number, BuscoJobsOffer>();
@@ -73,6 +92,9 @@ export async function searchBuscoJobs(params: JobSearchParams): Promise<JobListi
 }
 
 async function fetchOffers(url: string): Promise<BuscoJobsOffer[]> {
+  const cached = pageCache.get(url);
+  if (cached && Date.now() < cached.expiresAt) return cached.offers;
+
   const response = await fetch(url, {
     headers: {
       'User-Agent':
@@ -81,6 +103,7 @@ async function fetchOffers(url: string): Promise<BuscoJobsOffer[]> {
       'Accept-Language': 'pt-PT,pt;q=0.9,en;q=0.8',
       'Referer': `${BASE_URL}/`,
     },
+    signal: AbortSignal.timeout(10000),
     next: { revalidate: 300 },
   });
 
@@ -89,7 +112,9 @@ async function fetchOffers(url: string): Promise<BuscoJobsOffer[]> {
   }
 
   const html = await response.text();
-  return extractOffers(html);
+  const offers = extractOffers(html);
+  pageCache.set(url, { offers, expiresAt: Date.now() + PAGE_TTL });
+  return offers;
 }
 
 function extractOffers(html: string): BuscoJobsOffer[] {
@@ -1,7 +1,7 @@
 // Catho — Plataforma brasileira de empregos
 
 import type { JobListing, JobSearchParams } from '../types';
-import { cleanHtmlText } from '../helpers';
+import { cleanHtmlText, scanClassText, shortHash } from '../helpers';
 
 export async function searchCatho(params: JobSearchParams): Promise<JobListing[]> {
   try {
@@ -18,6 +18,7 @@ export async function searchCatho(params: JobSearchParams): Promise<JobListing[]
         'Upgrade-Insecure-Requests': '1',
         'Cache-Control': 'no-cache',
       },
+      signal: AbortSignal.timeout(10000),
       next: { revalidate: 300 },
     });
 
@@ -43,7 +44,13 @@ function parseCathoHTML(html: string): JobListing[] {
   const jsonLdPattern = /<script[^>]+type="application\/ld\+json"[^>]*>([\s\S]*?)<\/script>/gi;
   let match;
 
-  while ((match = jsonLdPattern.exec(html)) !== null) {
+  // Cheap substring checks first: skip the <script> scan when the page has no
+  // JSON-LD at all, and skip JSON.parse for blocks that aren't job postings
+  // (breadcrumbs, organization, etc).
+  const hasJsonLd = html.includes('application/ld+json');
+
+  while (hasJsonLd && (match = jsonLdPattern.exec(html)) !== null) {
+    if (!match[1].includes('JobPosting')) continue;
     try {
       const jsonData = JSON.parse(match[1]);
       const entries = Array.isArray(jsonData) ? jsonData : [jsonData];
@@ -68,9 +75,8 @@ function parseCathoHTML(html: string): JobListing[] {
 
   while ((match = cardPattern.exec(html)) !== null) {
     const block = match[1];
-    const title = extractTagText(block, 'h2') || extractTagText(block, 'h3');
-    const company = extractAttrClass(block, 'company') || extractAttrClass(block, 'employer');
-    const location = extractAttrClass(block, 'location') || extractAttrClass(block, 'city');
+    const title = extractHeading(block);
+    const { company, location } = extractCardDetails(block);
     const url = extractHref(block);
 
     if (title) {
@@ -121,7 +127,7 @@ function parseJobPosting(entry: Record<string, unknown>): JobListing | null {
   else if (empType.includes('hybrid') || empType.includes('híbrido')) jobType = 'Hybrid';
 
   return {
-    id: `catho-jsonld-${Buffer.from(url).toString('base64').substring(0, 16)}`,
+    id: `catho-jsonld-${shortHash(url)}`,
     source: 'catho' as const,
     title,
     company: company || 'Empresa',
@@ -148,14 +154,30 @@ function parseSalary(salary?: Record<string, unknown>): string | undefined {
   return undefined;
 }
 
-function extractTagText(html: string, tag: string): string {
-  const m = html.match(new RegExp(`<${tag}[^>]*>([^<]+)</${tag}>`, 'i'));
-  return m ? cleanHtmlText(m[1]) : '';
+// First h2/h3 heading of the card, found in one compiled pass
+const HEADING_RE = /<(h2|h3)[^>]*>([^<]+)<\/\1>/i;
+
+function extractHeading(html: string): string {
+  const m = html.match(HEADING_RE);
+  return m ? cleanHtmlText(m[2]) : '';
 }
 
-function extractAttrClass(html: string, className: string): string {
-  const m = html.match(new RegExp(`class="[^"]*${className}[^"]*"[^>]*>([^<]+)<`, 'i'));
-  return m ? cleanHtmlText(m[1]) : '';
+// Company and location both sit in elements whose class names them; collect
+// them in one scan of the card.
+function extractCardDetails(html: string): { company: string; location: string } {
+  let company = '';
+  let location = '';
+  scanClassText(html, (rawClass, text) => {
+    const className = rawClass.toLowerCase();
+    if (!company && (className.includes('company') || className.includes('employer'))) {
+      company = cleanHtmlText(text);
+    }
+    if (!location && (className.includes('location') || className.includes('city'))) {
+      location = cleanHtmlText(text);
+    }
+    return Boolean(company && location);
+  });
+  return { company, location };
 }
 
 function extractHref(html: string): string {
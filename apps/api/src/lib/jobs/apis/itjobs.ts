@@ -3,6 +3,22 @@
 import type { JobListing, JobSearchParams } from '../types';
 import { cleanHtmlText } from '../helpers';
 
+// Locations ITJobs prints as plain text next to each listing. The lookup regex
+// is built once from this table rather than per listing.
+const LOCATIONS = [
+  'Lisboa', 'Porto', 'Braga', 'Coimbra', 'Aveiro', 'Faro', 'Leiria', 'Setúbal', 'Viseu',
+  'Remote', 'Remoto',
+] as const;
+
+const LOCATION_RE = new RegExp(
+  `<(?:span|div)[^>]*>([^<]*(?:${LOCATIONS.join('|')})[^<]*)<\\/(?:span|div)>`,
+  'i'
+);
+
+// Navigation/non-job links that also match the /oferta/ link pattern
+const NAV_TITLE_RE = /pesquisa|login|registar/i;
+const NAV_URL_RE = /\/(?:local|emprego)\//;
+
 interface ITJobsJob {
   title: string;
   company: string;
@@ -23,6 +39,7 @@ export async function searchITJobs(params: JobSearchParams): Promise<JobListing[
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'pt-PT,pt;q=0.9,en-US;q=0.8,en;q=0.7',
       },
+      signal: AbortSignal.timeout(10000),
       next: { revalidate: 300 },
     });
 
@@ -74,6 +91,11 @@ function parseITJobsHTML(html: string): ITJobsJob[] {
     }
     seenUrls.add(url);
 
+    // Skip navigation links and non-job entries before any context parsing
+    if (NAV_TITLE_RE.test(title) || NAV_URL_RE.test(url)) {
+      continue;
+    }
+
     // Get context around the match to extract company and location
     const contextStart = Math.max(0, match.index - 500);
     const contextEnd = Math.min(html.length, match.index + 1500);
@@ -101,7 +123,7 @@ function parseITJobsHTML(html: string): ITJobsJob[] {
 
     // Extract location - usually plain text like "Lisboa" or "Porto, Lisboa"
     let location = 'Portugal';
-    const locationMatch = context.match(/<(?:span|div)[^>]*>([^<]*(?:Lisboa|Porto|Braga|Coimbra|Aveiro|Faro|Leiria|Setúbal|Viseu|Remote|Remoto)[^<]*)<\/(?:span|div)>/i);
+    const locationMatch = context.match(LOCATION_RE);
     if (locationMatch) {
       location = cleanHtmlText(locationMatch[1]);
     }
@@ -113,15 +135,6 @@ function parseITJobsHTML(html: string): ITJobsJob[] {
       salary = cleanHtmlText(salaryMatch[0]);
     }
 
-    // Skip navigation links and non-job entries
-    if (title.toLowerCase().includes('pesquisa') ||
-        title.toLowerCase().includes('login') ||
-        title.toLowerCase().includes('registar') ||
-        url.includes('/local/') ||
-        url.includes('/emprego/')) {
-      continue;
-    }
-
     jobs.push({
       title,
       company,
@@ -16,6 +16,7 @@ export async function searchLinkedIn(params: JobSearchParams): Promise<JobListin
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
       },
+      signal: AbortSignal.timeout(10000),
       next: { revalidate: 300 },
     });
 
@@ -24,42 +25,44 @@ export async function searchLinkedIn(params: JobSearchParams): Promise<JobListin
     }
 
     const html = await response.text();
-    const jobs = parseLinkedInHTML(html, params.country || 'br');
-
-    return jobs.slice(0, params.limit || 50);
+    return parseLinkedInHTML(html, params.country || 'br', params.limit || 50);
   } catch (error) {
     console.error('LinkedIn scraping error:', error);
     return [];
   }
 }
 
-function parseLinkedInHTML(html: string, country: string): JobListing[] {
+function parseLinkedInHTML(html: string, country: string, limit: number): JobListing[] {
   const jobs: JobListing[] = [];
-  const cards = html.split('<li').slice(1);
+  const cards = html.split('<li');
 
-  cards.forEach((card, index) => {
+  // Stop once `limit` jobs are built instead of parsing every card and
+  // slicing afterwards; cards without title/url skip the remaining matches.
+  for (let i = 1; i < cards.length && jobs.length < limit; i++) {
+    const card = cards[i];
+    const index = i - 1;
     const titleMatch = card.match(/base-search-card__title[^>]*>([^<]+)/);
-    const urlMatch = card.match(/base-card__full-link[^>]*href="([^"?]+)/);
+    const urlMatch = titleMatch && card.match(/base-card__full-link[^>]*href="([^"?]+)/);
+    if (!titleMatch || !urlMatch) continue;
+
     const locationMatch = card.match(/job-search-card__location">([^<]+)/);
     const companyMatch = card.match(/base-search-card__subtitle[^>]*>[^<]*<a[^>]*>([^<]+)/);
     const postedMatch = card.match(/job-search-card__listdate[^>]*datetime="([^"]+)"/);
 
-    if (titleMatch && urlMatch) {
-      jobs.push({
-        id: `linkedin-${Date.now()}-${index}`,
-        source: 'linkedin',
-        title: titleMatch[1].trim(),
-        company: companyMatch ? companyMatch[1].trim() : 'Empresa no LinkedIn',
-        description: '',
-        url: urlMatch[1],
-        location: locationMatch ? locationMatch[1].trim() : (country === 'pt' ? 'Portugal' : 'Brasil'),
-        jobType: 'On-site',
-        tags: [],
-        postedAt: postedMatch ? new Date(postedMatch[1]) : undefined,
-        country: country,
-      });
-    }
-  });
+    jobs.push({
+      id: `linkedin-${Date.now()}-${index}`,
+      source: 'linkedin',
+      title: titleMatch[1].trim(),
+      company: companyMatch ? companyMatch[1].trim() : 'Empresa no LinkedIn',
+      description: '',
+      url: urlMatch[1],
+      location: locationMatch ? locationMatch[1].trim() : (country === 'pt' ? 'Portugal' : 'Brasil'),
+      jobType: 'On-site',
+      tags: [],
+      postedAt: postedMatch ? new Date(postedMatch[1]) : undefined,
+      country: country,
+    });
+  }
 
   return jobs;
 }
@@ -23,6 +23,7 @@ export async function searchNetEmpregos(params: JobSearchParams): Promise<JobLis
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'pt-PT,pt;q=0.9,en-US;q=0.8,en;q=0.7',
       },
+      signal: AbortSignal.timeout(10000),
       next: { revalidate: 300 },
     });
 
@@ -60,12 +61,21 @@ function parseNetEmpregosHTML(html: string): NetEmpregosJob[] {
   // Pattern for job items with h2 titles
   const jobPattern = /<h2[^>]*>[\s\S]*?<a[^>]*class="oferta-link"[^>]*href=["']?([^"'\s>]+)["']?[^>]*>([^<]+)<\/a>/gi;
 
+  // Deduplicate by URL as we go, so repeated cards never get their context
+  // sliced out and regex-scanned, nor a throwaway object allocated.
+  const seen = new Set<string>();
+
   let match;
   while ((match = jobPattern.exec(html)) !== null) {
-    const url = match[1].replace(/^=/, ''); // Remove leading = if present
+    const rawUrl = match[1].replace(/^=/, ''); // Remove leading = if present
+    const url = rawUrl.startsWith('/') ? rawUrl : `/${rawUrl}`;
+    if (seen.has(url)) continue;
+
     const title = cleanHtmlText(match[2]);
 
     if (title && title.length > 3) {
+      seen.add(url);
+
       // Find the job-item container around this match to extract company and location
       const contextStart = Math.max(0, match.index - 100);
       const contextEnd = Math.min(html.length, match.index + 800);
@@ -87,18 +97,12 @@ function parseNetEmpregosHTML(html: string): NetEmpregosJob[] {
         title,
         company,
         location,
-        url: url.startsWith('/') ? url : `/${url}`,
+        url,
         description: '',
         date,
       });
     }
   }
 
-  // Deduplicate by URL
-  const seen = new Set<string>();
-  return jobs.filter(job => {
-    if (seen.has(job.url)) return false;
-    seen.add(job.url);
-    return true;
-  });
+  return jobs;
 }
@@ -1,7 +1,7 @@
 // Programathor — Plataforma de vagas tech do Brasil
 
 import type { JobListing, JobSearchParams } from '../types';
-import { cleanHtmlText } from '../helpers';
+import { cleanHtmlText, scanClassText } from '../helpers';
 
 export async function searchProgramathor(params: JobSearchParams): Promise<JobListing[]> {
   try {
@@ -16,6 +16,7 @@ export async function searchProgramathor(params: JobSearchParams): Promise<JobLi
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8',
       },
+      signal: AbortSignal.timeout(10000),
       next: { revalidate: 300 },
     });
 
@@ -41,6 +42,10 @@ function parseProgramathorHTML(html: string): JobListing[] {
 
   // Pattern 1: article/list item blocks containing job info
   const cardPattern = /<(?:li|article)[^>]*data-id="([^"]*)"[^>]*>([\s\S]*?)(?=<(?:li|article)[^>]*data-id|$)/gi;
+  // Raw relative hrefs of emitted jobs: a repeat is dropped before any field
+  // extraction. Only marked once the card has a title, so a title-less fragment
+  // (e.g. a bare logo link) can't claim the href ahead of the real card.
+  const seenHrefs = new Set<string>();
   let match;
   let index = 0;
 
@@ -48,14 +53,19 @@ function parseProgramathorHTML(html: string): JobListing[] {
     const jobId = match[1];
     const block = match[2];
 
-    const title = extractTitle(block);
-    const company = extractCompany(block);
-    const location = extractLocation(block);
     const url = extractUrl(block);
-    const tags = extractTags(block);
+    if (url && seenHrefs.has(url)) {
+      index++;
+      continue;
+    }
+
+    const fields = extractCardFields(block);
+    const title = extractHeading(block) || fields.title;
+    const { company, location, tags } = fields;
     const postedAt = extractDate(block);
 
     if (title) {
+      if (url) seenHrefs.add(url);
       jobs.push({
         id: `programathor-${jobId || index}`,
         source: 'programathor' as const,
@@ -76,15 +86,18 @@ function parseProgramathorHTML(html: string): JobListing[] {
   // Fallback: simpler pattern looking for h2/h3 headings with links
   if (jobs.length === 0) {
     const linkPattern = /<a[^>]+href="(\/jobs-tech\/[^"]+)"[^>]*>\s*<(?:h2|h3|h4)[^>]*>([^<]+)<\/(?:h2|h3|h4)>/gi;
+    const seenLinks = new Set<string>();
     let i = 0;
-    while ((linkPattern.exec(html)) !== null && i < 50) {
-      const href = linkPattern.source.match(/href="([^"]+)"/)?.[1] || '';
-      const title = linkPattern.source.match(/>([^<]+)<\//)?.[1] || '';
-      if (title && href) {
+    while ((match = linkPattern.exec(html)) !== null && i < 50) {
+      const href = match[1];
+      const title = cleanHtmlText(match[2]);
+      if (seenLinks.has(href)) continue;
+      if (title) {
+        seenLinks.add(href);
         jobs.push({
           id: `programathor-fallback-${i}`,
           source: 'programathor' as const,
-          title: cleanHtmlText(title),
+          title,
           company: 'Empresa',
           description: '',
           url: `https://programathor.com.br${href}`,
@@ -101,26 +114,45 @@ function parseProgramathorHTML(html: string): JobListing[] {
   return jobs;
 }
 
-function extractTitle(block: string): string {
+function extractHeading(block: string): string {
   // Look for h2/h3/h4 tags
   const m = block.match(/<(?:h2|h3|h4)[^>]*>([^<]+)<\/(?:h2|h3|h4)>/i);
-  if (m) return cleanHtmlText(m[1]);
-  // Look for class="title" or class="job-title"
-  const m2 = block.match(/class="[^"]*(?:title|job-name)[^"]*"[^>]*>([^<]+)</i);
-  if (m2) return cleanHtmlText(m2[1]);
-  return '';
+  return m ? cleanHtmlText(m[1]) : '';
 }
 
-function extractCompany(block: string): string {
-  const m = block.match(/class="[^"]*(?:company|employer)[^"]*"[^>]*>([^<]+)</i);
-  if (m) return cleanHtmlText(m[1]);
-  return '';
+interface CardFields {
+  title: string;
+  company: string;
+  location: string;
+  tags: string[];
 }
 
-function extractLocation(block: string): string {
-  const m = block.match(/class="[^"]*(?:location|city)[^"]*"[^>]*>([^<]+)</i);
-  if (m) return cleanHtmlText(m[1]);
-  return '';
+// Single pass over every class-bearing element of the card, filing its text
+// under title/company/location/tags by class name (first match wins for the
+// scalar fields; tags are capped at MAX_TAGS as they are collected, so extras
+// are never cleaned). Replaces one regex scan of the block per field.
+const TITLE_CLASS_RE = /title|job-name/i;
+const COMPANY_CLASS_RE = /company|employer/i;
+const LOCATION_CLASS_RE = /location|city/i;
+const TAG_CLASS_RE = /tag|badge|skill/i;
+const MAX_TAGS = 10;
+
+function extractCardFields(block: string): CardFields {
+  const fields: CardFields = { title: '', company: '', location: '', tags: [] };
+  const tags = new Set<string>();
+
+  scanClassText(block, (className, raw) => {
+    if (!fields.title && TITLE_CLASS_RE.test(className)) fields.title = cleanHtmlText(raw);
+    if (!fields.company && COMPANY_CLASS_RE.test(className)) fields.company = cleanHtmlText(raw);
+    if (!fields.location && LOCATION_CLASS_RE.test(className)) fields.location = cleanHtmlText(raw);
+    if (tags.size < MAX_TAGS && TAG_CLASS_RE.test(className)) {
+      const tag = cleanHtmlText(raw);
+      if (tag && tag.length < 30) tags.add(tag);
+    }
+  });
+
+  fields.tags = Array.from(tags);
+  return fields;
 }
 
 function extractUrl(block: string): string {
@@ -128,17 +160,6 @@ function extractUrl(block: string): string {
   return m ? m[1] : '';
 }
 
-function extractTags(block: string): string[] {
-  const tags: string[] = [];
-  const tagPattern = /class="[^"]*(?:tag|badge|skill)[^"]*"[^>]*>([^<]+)</gi;
-  let m;
-  while ((m = tagPattern.exec(block)) !== null) {
-    const tag = cleanHtmlText(m[1]);
-    if (tag && tag.length < 30) tags.push(tag);
-  }
-  return Array.from(new Set(tags)).slice(0, 10);
-}
-
 function extractDate(block: string): Date | undefined {
   const m = block.match(/datetime="([^"]+)"/i);
   if (m) {
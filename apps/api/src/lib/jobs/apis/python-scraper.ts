@@ -1,12 +1,20 @@
 // Integration with Python scraper service
 
 import type { JobListing, JobSearchParams, JobSourceType } from '../types';
+import { logger } from '../../logger';
 
 // Optional source: only used when PYTHON_SCRAPER_URL is explicitly configured.
 // No localhost fallback — an unset/empty URL disables this source entirely so it
 // never adds latency to job search.
 const PYTHON_SCRAPER_URL = process.env.PYTHON_SCRAPER_URL || '';
 
+// Last /health probe result. GeekHunter and Vagas.com.br both check availability
+// before every search, so reuse the answer briefly instead of probing per source.
+const HEALTH_TTL = 30 * 1000; // 30 seconds
+let healthCache: { ok: boolean; expiresAt: number } | null = null;
+// Probe in flight, shared so concurrent callers on a cold cache send one request
+let healthProbe: Promise<boolean> | null = null;
+
 interface PythonJob {
   id: string;
   source: string;
@@ -88,21 +96,28 @@ export async function searchPythonScraper(
 }
 
 /**
- * Search GeekHunter using Python scraper
+ * Search a single Python-backed source (GeekHunter, Vagas.com.br), skipping
+ * the request when the service is down. Never throws.
  */
-export async function searchGeekHunterPython(
-  params: JobSearchParams
+export async function searchPythonSource(
+  params: JobSearchParams,
+  source: 'geekhunter' | 'vagascombr'
 ): Promise<JobListing[]> {
-  return searchPythonScraper(params, 'geekhunter');
-}
+  try {
+    const available = await isPythonScraperAvailable();
+    if (!available) {
+      logger.warn(source, 'Python scraper not available');
+      return [];
+    }
 
-/**
- * Search Vagas.com.br using Python scraper
- */
-export async function searchVagasComBrPython(
-  params: JobSearchParams
-): Promise<JobListing[]> {
-  return searchPythonScraper(params, 'vagascombr');
+    const results = await searchPythonScraper(params, source);
+    logger.info(source, `Found ${results.length} jobs`, { count: results.length });
+    return results;
+  } catch (error) {
+    const err = error instanceof Error ? error : new Error(String(error));
+    logger.error(source, `Scraping error: ${err.message}`, { error: err.message });
+    return [];
+  }
 }
 
 /**
@@ -110,15 +125,27 @@ export async function searchVagasComBrPython(
  */
 export async function isPythonScraperAvailable(): Promise<boolean> {
   if (!PYTHON_SCRAPER_URL) return false; // not configured -> skip instantly (no fetch)
+  if (healthCache && Date.now() < healthCache.expiresAt) return healthCache.ok;
+
+  healthProbe ??= probeHealth().finally(() => {
+    healthProbe = null;
+  });
+  return healthProbe;
+}
+
+async function probeHealth(): Promise<boolean> {
+  let ok = false;
   try {
     const response = await fetch(`${PYTHON_SCRAPER_URL}/health`, {  // /health is unchanged
       method: 'GET',
       signal: AbortSignal.timeout(3000),
     });
-    return response.ok;
+    ok = response.ok;
   } catch {
-    return false;
+    ok = false;
   }
+  healthCache = { ok, expiresAt: Date.now() + HEALTH_TTL };
+  return ok;
 }
 
 /**
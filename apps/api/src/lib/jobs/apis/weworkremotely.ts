@@ -3,6 +3,15 @@
 
 import type { JobListing, JobSearchParams } from '../types';
 
+const ITEM_RE = /<item>([\s\S]*?)<\/item>/g;
+const TITLE_RE = /<title>([^<]*)<\/title>/;
+const TITLE_CDATA_RE = /<title><!\[CDATA\[([\s\S]*?)\]\]><\/title>/;
+const LINK_RE = /<link>([^<]*)<\/link>/;
+const LINK_CDATA_RE = /<link><!\[CDATA\[([\s\S]*?)\]\]><\/link>/;
+const PUB_DATE_RE = /<pubDate>([^<]*)<\/pubDate>/;
+const DESCRIPTION_RE = /<description>([^<]*)<\/description>/;
+const DESCRIPTION_CDATA_RE = /<description><!\[CDATA\[([\s\S]*?)\]\]><\/description>/;
+
 export async function searchWeWorkRemotely(params: JobSearchParams): Promise<JobListing[]> {
   try {
     // WWR provides category-based RSS feeds; for generic search use the "all jobs" feed
@@ -32,18 +41,24 @@ export async function searchWeWorkRemotely(params: JobSearchParams): Promise<Job
 
 function parseWWRRSS(xml: string, params: JobSearchParams): JobListing[] {
   const jobs: JobListing[] = [];
-  const items = xml.split('<item>').slice(1);
   const keyword = params.keyword?.toLowerCase() || '';
-
-  items.forEach((item, index) => {
-    const title = extractTag(item, 'title');
-    const link = extractTag(item, 'link') || extractCDATA(item, 'link');
-    const pubDate = extractTag(item, 'pubDate');
-    const description = extractCDATA(item, 'description') || extractTag(item, 'description') || '';
+  let itemCount = 0;
+  let itemMatch;
+
+  // Walk the <item> blocks lazily instead of splitting the whole feed into an
+  // intermediate array first. ITEM_RE is shared, so restart it for each feed.
+  ITEM_RE.lastIndex = 0;
+  while ((itemMatch = ITEM_RE.exec(xml)) !== null) {
+    const index = itemCount++;
+    const item = itemMatch[1];
+    const link = extractFirst(item, LINK_RE) || extractFirst(item, LINK_CDATA_RE);
+    const pubDate = extractFirst(item, PUB_DATE_RE);
+    const description = extractFirst(item, DESCRIPTION_CDATA_RE) || extractFirst(item, DESCRIPTION_RE);
 
     // Extract company from title: "Company: Job Title at Company"
     // WWR format: <title><![CDATA[Company: Job Title]]></title>
-    const rawTitle = extractCDATA(item, 'title') || title;
+    // Plain <title> is only scanned when the CDATA form is absent.
+    const rawTitle = extractFirst(item, TITLE_CDATA_RE) || extractFirst(item, TITLE_RE);
     let company = '';
     let jobTitle = rawTitle;
 
@@ -57,12 +72,12 @@ function parseWWRRSS(xml: string, params: JobSearchParams): JobListing[] {
     const regionMatch = description.match(/Region:\s*([^<\n]+)/i);
     const location = regionMatch ? regionMatch[1].trim() : 'Remote';
 
-    if (!jobTitle || !link) return;
+    if (!jobTitle || !link) continue;
 
     // Filter by keyword if provided
     if (keyword) {
       const searchText = `${jobTitle} ${company} ${description}`.toLowerCase();
-      if (!searchText.includes(keyword)) return;
+      if (!searchText.includes(keyword)) continue;
     }
 
     // Clean URL (RSS items sometimes have HTML anchors embedded)
@@ -81,18 +96,13 @@ function parseWWRRSS(xml: string, params: JobSearchParams): JobListing[] {
       postedAt: pubDate ? new Date(pubDate) : undefined,
       country: 'remote',
     });
-  });
+  }
 
   return jobs;
 }
 
-function extractTag(xml: string, tag: string): string {
-  const match = xml.match(new RegExp(`<${tag}>([^<]*)</${tag}>`));
-  return match ? match[1].trim() : '';
-}
-
-function extractCDATA(xml: string, tag: string): string {
-  const match = xml.match(new RegExp(`<${tag}><!\\[CDATA\\[([\\s\\S]*?)\\]\\]></${tag}>`));
+function extractFirst(xml: string, pattern: RegExp): string {
+  const match = xml.match(pattern);
   return match ? match[1].trim() : '';
 }
 
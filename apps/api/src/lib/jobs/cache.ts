@@ -16,19 +16,24 @@ interface CacheEntry {
 
 const cache = new Map<string, CacheEntry>();
 const DEFAULT_TTL = 5 * 60 * 1000; // 5 minutes
+// Upper bound on cached searches. Map keeps insertion order, so entries are
+// re-inserted on access and the first key is always the least recently used.
+const MAX_CACHE_ENTRIES = 200;
 
 /**
  * Generate cache key from search parameters
  */
 function generateCacheKey(params: JobSearchParams, sources: string[]): string {
-  const normalizedParams = {
-    keyword: (params.keyword || '').toLowerCase().trim(),
-    country: params.country || 'all',
-    limit: params.limit || 50,
-    maxAgeDays: params.maxAgeDays || 0,
-    sources: sources.sort().join(','),
-  };
-  return JSON.stringify(normalizedParams);
+  // Plain delimited string: cheaper than JSON.stringify on every lookup. Keyword
+  // goes last since it is the only free-text field. Sources are copied before
+  // sorting so the caller's array isn't reordered.
+  return [
+    params.country || 'all',
+    params.limit || 50,
+    params.maxAgeDays || 0,
+    [...sources].sort().join(','),
+    (params.keyword || '').toLowerCase().trim(),
+  ].join('|');
 }
 
 /**
@@ -48,6 +53,10 @@ export function getCachedResults(
     return null;
   }
 
+  // Mark as most recently used
+  cache.delete(key);
+  cache.set(key, entry);
+
   return entry.jobs;
 }
 
@@ -63,12 +72,20 @@ export function setCachedResults(
   const key = generateCacheKey(params, sources);
   const now = Date.now();
 
+  cache.delete(key);
   cache.set(key, {
     jobs,
     total: jobs.length,
     timestamp: now,
     expiresAt: now + ttl,
   });
+
+  // Evict least recently used entries beyond the cap
+  while (cache.size > MAX_CACHE_ENTRIES) {
+    const oldestKey = cache.keys().next().value;
+    if (oldestKey === undefined) break;
+    cache.delete(oldestKey);
+  }
 }
 
 /**
@@ -3,6 +3,8 @@
 import type { JobListing } from './types';
 import { generateJobHash } from './helpers';
 
+const RELIABLE_SOURCES = new Set<string>(['linkedin', 'remoteok', 'remotive']);
+
 /**
  * Normalize job key for comparison
  * Creates a unique identifier based on title and company
@@ -47,8 +49,7 @@ export function getCompletenessScore(job: JobListing): number {
   if (job.tags && job.tags.length > 0) score += 1;
 
   // Source reliability bonus
-  const reliableSources = ['linkedin', 'remoteok', 'remotive'];
-  if (reliableSources.includes(job.source)) score += 2;
+  if (RELIABLE_SOURCES.has(job.source)) score += 2;
 
   return score;
 }
@@ -57,28 +58,32 @@ export function getCompletenessScore(job: JobListing): number {
  * Remove duplicate jobs, keeping the most complete version
  */
 export function deduplicateJobs(jobs: JobListing[]): JobListing[] {
-  const seen = new Map<string, JobListing>();
+  // The kept job's score is computed on its first collision and then reused,
+  // so unique jobs are never scored and repeat collisions score only the newcomer.
+  const seen = new Map<string, { job: JobListing; score?: number }>();
 
   for (const job of jobs) {
     const key = normalizeJobKey(job);
     const existing = seen.get(key);
 
     if (!existing) {
-      seen.set(key, job);
+      seen.set(key, { job });
     } else {
       // Keep the one with higher completeness score
-      if (getCompletenessScore(job) > getCompletenessScore(existing)) {
-        seen.set(key, job);
+      existing.score ??= getCompletenessScore(existing.job);
+      const score = getCompletenessScore(job);
+      if (score > existing.score) {
+        seen.set(key, { job, score });
       }
     }
   }
 
-  return Array.from(seen.values());
+  return Array.from(seen.values(), (entry) => entry.job);
 }
 
 /**
  * Advanced deduplication with similarity matching
- * Uses Levenshtein distance for fuzzy matching
+ * Uses Jaccard similarity on character trigrams for fuzzy matching
  */
 export function deduplicateJobsAdvanced(
   jobs: JobListing[],
@@ -87,29 +92,27 @@ export function deduplicateJobsAdvanced(
   const result: JobListing[] = [];
   const processed = new Set<number>();
 
+  // Key, trigram set and score depend only on the job, so build them once
+  // instead of once per pair in the loop below.
+  const keys = jobs.map(normalizeJobKey);
+  const trigrams = keys.map(getTrigramSet);
+  const scores = jobs.map(getCompletenessScore);
+
   for (let i = 0; i < jobs.length; i++) {
     if (processed.has(i)) continue;
 
-    const job = jobs[i];
-    const key = normalizeJobKey(job);
-    let bestJob = job;
-    let bestScore = getCompletenessScore(job);
+    let bestJob = jobs[i];
+    let bestScore = scores[i];
 
     // Check for similar jobs
     for (let j = i + 1; j < jobs.length; j++) {
       if (processed.has(j)) continue;
 
-      const otherJob = jobs[j];
-      const otherKey = normalizeJobKey(otherJob);
-
-      // Check if keys are similar enough
-      const similarity = calculateSimilarity(key, otherKey);
-      if (similarity >= similarityThreshold) {
+      if (isSimilar(keys[i], keys[j], trigrams[i], trigrams[j], similarityThreshold)) {
         processed.add(j);
-        const otherScore = getCompletenessScore(otherJob);
-        if (otherScore > bestScore) {
-          bestJob = otherJob;
-          bestScore = otherScore;
+        if (scores[j] > bestScore) {
+          bestJob = jobs[j];
+          bestScore = scores[j];
         }
       }
     }
@@ -122,37 +125,43 @@ export function deduplicateJobsAdvanced(
 }
 
 /**
- * Calculate similarity between two strings (0-1)
- * Uses simplified Jaccard similarity on character trigrams
+ * Whether two keys reach the Jaccard similarity threshold on their trigram sets
  */
-function calculateSimilarity(str1: string, str2: string): number {
-  if (str1 === str2) return 1;
-  if (str1.length < 3 || str2.length < 3) {
-    return str1 === str2 ? 1 : 0;
-  }
-
-  const trigrams1 = new Set(getTrigrams(str1));
-  const trigrams2 = new Set(getTrigrams(str2));
+function isSimilar(
+  key1: string,
+  key2: string,
+  trigrams1: Set<string>,
+  trigrams2: Set<string>,
+  threshold: number
+): boolean {
+  if (key1 === key2) return true;
+  if (key1.length < 3 || key2.length < 3) return false;
+
+  // Jaccard can't exceed smaller/larger set size, so skip the set walk when
+  // the sizes alone rule a match out.
+  const small = trigrams1.size <= trigrams2.size ? trigrams1 : trigrams2;
+  const large = small === trigrams1 ? trigrams2 : trigrams1;
+  if (small.size < threshold * large.size) return false;
 
   let intersection = 0;
-  const trigrams1Array = Array.from(trigrams1);
-  for (const trigram of trigrams1Array) {
-    if (trigrams2.has(trigram)) {
+  const smallArray = Array.from(small);
+  for (const trigram of smallArray) {
+    if (large.has(trigram)) {
       intersection++;
     }
   }
 
-  const union = trigrams1.size + trigrams2.size - intersection;
-  return union === 0 ? 0 : intersection / union;
+  const union = small.size + large.size - intersection;
+  return union !== 0 && intersection / union >= threshold;
 }
 
 /**
- * Get character trigrams from a string
+ * Get the set of character trigrams in a string
  */
-function getTrigrams(str: string): string[] {
-  const trigrams: string[] = [];
+function getTrigramSet(str: string): Set<string> {
+  const trigrams = new Set<string>();
   for (let i = 0; i <= str.length - 3; i++) {
-    trigrams.push(str.slice(i, i + 3));
+    trigrams.add(str.slice(i, i + 3));
   }
   return trigrams;
 }
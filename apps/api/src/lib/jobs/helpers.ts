@@ -2,6 +2,32 @@
 
 import type { JobListing } from './types';
 
+// Patterns used by the per-job text helpers below. Compiled once at module load
+// instead of on every call, since these run for every listing of every source.
+
+// Common patterns for salary
+const SALARY_PATTERNS = [
+  // USD patterns
+  /\$\s*(\d{1,3}(?:,?\d{3})*)\s*(?:-|to|–)\s*\$?\s*(\d{1,3}(?:,?\d{3})*)/i,
+  /(\d{1,3}(?:,?\d{3})*)\s*(?:-|to|–)\s*(\d{1,3}(?:,?\d{3})*)\s*(?:usd|dollars?)/i,
+  // BRL patterns
+  /R\$\s*(\d{1,3}(?:[.,]?\d{3})*)\s*(?:-|a|–)\s*R?\$?\s*(\d{1,3}(?:[.,]?\d{3})*)/i,
+  // EUR patterns
+  /€\s*(\d{1,3}(?:[.,]?\d{3})*)\s*(?:-|to|–)\s*€?\s*(\d{1,3}(?:[.,]?\d{3})*)/i,
+  // Generic k patterns
+  /(\d+)\s*k\s*(?:-|to|–)\s*(\d+)\s*k/i,
+];
+
+const SENIOR_RE = /\b(senior|sr\.?|lead|principal|staff|architect|head of)\b/i;
+const JUNIOR_RE = /\b(junior|jr\.?|entry[\s-]?level|trainee|intern|estagio|estagiario|estágio|estagiário)\b/i;
+const MID_RE = /\b(mid[\s-]?level|pleno|intermediate|regular)\b/i;
+
+const REMOTE_RE = /\b(remote|remoto|trabalho remoto|home[\s-]?office|anywhere)\b/i;
+const HYBRID_RE = /\b(hybrid|hibrido|híbrido)\b/i;
+const ONSITE_RE = /\b(on[\s-]?site|presencial|in[\s-]?office|in[\s-]?person)\b/i;
+
+const PT_DATE_RE = /(\d{1,2})[-\/](\d{1,2})[-\/](\d{2,4})/;
+
 /**
  * Format salary range into human-readable string
  */
@@ -33,16 +59,41 @@ export function formatNumber(num: number): string {
  * Clean HTML text by removing tags and decoding entities
  */
 export function cleanHtmlText(text: string): string {
-  return text
-    .replace(/<[^>]+>/g, '')
-    .replace(/&nbsp;/g, ' ')
-    .replace(/&amp;/g, '&')
-    .replace(/&lt;/g, '<')
-    .replace(/&gt;/g, '>')
-    .replace(/&quot;/g, '"')
-    .replace(/&#039;/g, "'")
-    .replace(/\s+/g, ' ')
-    .trim();
+  // Most fields are a plain text leaf: only run the tag/entity passes when
+  // the markup they target is actually present.
+  let result = text;
+  if (result.includes('<')) {
+    result = result.replace(/<[^>]+>/g, '');
+  }
+  if (result.includes('&')) {
+    result = result
+      .replace(/&nbsp;/g, ' ')
+      .replace(/&amp;/g, '&')
+      .replace(/&lt;/g, '<')
+      .replace(/&gt;/g, '>')
+      .replace(/&quot;/g, '"')
+      .replace(/&#039;/g, "'");
+  }
+  return result.replace(/\s+/g, ' ').trim();
+}
+
+/**
+ * Walk every class-bearing element of an HTML fragment once, in document order,
+ * calling `visit` with its class attribute and raw leading text. Return true
+ * from `visit` to stop early. Lets scrapers fill several card fields in a
+ * single pass instead of one regex scan per field.
+ */
+export function scanClassText(
+  html: string,
+  visit: (className: string, text: string) => boolean | void
+): void {
+  // A class attribute followed by the element's leading text node. Created per
+  // call: a shared /g regex's lastIndex would break if `visit` scanned again.
+  const classTextRe = /class="([^"]*)"[^>]*>([^<]+)</gi;
+  let match;
+  while ((match = classTextRe.exec(html)) !== null) {
+    if (visit(match[1], match[2])) break;
+  }
 }
 
 /**
@@ -67,7 +118,7 @@ export function filterJobsByAge(jobs: JobListing[], maxAgeDays: number): JobList
 export function parsePortugueseDate(dateStr: string): Date | undefined {
   if (!dateStr) return undefined;
 
-  const match = dateStr.match(/(\d{1,2})[-\/](\d{1,2})[-\/](\d{2,4})/);
+  const match = dateStr.match(PT_DATE_RE);
   if (match) {
     const day = parseInt(match[1], 10);
     const month = parseInt(match[2], 10) - 1;
@@ -83,20 +134,7 @@ export function parsePortugueseDate(dateStr: string): Date | undefined {
  * Extract salary from description text
  */
 export function extractSalaryFromText(text: string): string | undefined {
-  // Common patterns for salary
-  const patterns = [
-    // USD patterns
-    /\$\s*(\d{1,3}(?:,?\d{3})*)\s*(?:-|to|–)\s*\$?\s*(\d{1,3}(?:,?\d{3})*)/i,
-    /(\d{1,3}(?:,?\d{3})*)\s*(?:-|to|–)\s*(\d{1,3}(?:,?\d{3})*)\s*(?:usd|dollars?)/i,
-    // BRL patterns
-    /R\$\s*(\d{1,3}(?:[.,]?\d{3})*)\s*(?:-|a|–)\s*R?\$?\s*(\d{1,3}(?:[.,]?\d{3})*)/i,
-    // EUR patterns
-    /€\s*(\d{1,3}(?:[.,]?\d{3})*)\s*(?:-|to|–)\s*€?\s*(\d{1,3}(?:[.,]?\d{3})*)/i,
-    // Generic k patterns
-    /(\d+)\s*k\s*(?:-|to|–)\s*(\d+)\s*k/i,
-  ];
-
-  for (const pattern of patterns) {
+  for (const pattern of SALARY_PATTERNS) {
     const match = text.match(pattern);
     if (match) {
       return match[0];
@@ -113,17 +151,17 @@ export function detectExperienceLevel(title: string, description: string): 'juni
   const text = `${title} ${description}`.toLowerCase();
 
   // Senior patterns
-  if (/\b(senior|sr\.?|lead|principal|staff|architect|head of)\b/i.test(text)) {
+  if (SENIOR_RE.test(text)) {
     return 'senior';
   }
 
   // Junior patterns
-  if (/\b(junior|jr\.?|entry[\s-]?level|trainee|intern|estagio|estagiario|estágio|estagiário)\b/i.test(text)) {
+  if (JUNIOR_RE.test(text)) {
     return 'junior';
   }
 
   // Mid-level patterns
-  if (/\b(mid[\s-]?level|pleno|intermediate|regular)\b/i.test(text)) {
+  if (MID_RE.test(text)) {
     return 'mid';
   }
 
@@ -136,15 +174,15 @@ export function detectExperienceLevel(title: string, description: string): 'juni
 export function detectJobType(job: Partial<JobListing>): 'remote' | 'hybrid' | 'onsite' | undefined {
   const text = `${job.title || ''} ${job.location || ''} ${job.jobType || ''} ${job.description || ''}`.toLowerCase();
 
-  if (/\b(remote|remoto|trabalho remoto|home[\s-]?office|anywhere)\b/i.test(text)) {
+  if (REMOTE_RE.test(text)) {
     return 'remote';
   }
 
-  if (/\b(hybrid|hibrido|híbrido)\b/i.test(text)) {
+  if (HYBRID_RE.test(text)) {
     return 'hybrid';
   }
 
-  if (/\b(on[\s-]?site|presencial|in[\s-]?office|in[\s-]?person)\b/i.test(text)) {
+  if (ONSITE_RE.test(text)) {
     return 'onsite';
   }
 
@@ -219,6 +257,20 @@ export function generateJobHash(job: JobListing): string {
   return `${title}-${company}`;
 }
 
+/**
+ * Short, stable id token for a string (e.g. a job URL).
+ * 32-bit FNV-1a: a non-cryptographic hash is enough for listing ids and
+ * avoids hashing through node:crypto for every parsed card.
+ */
+export function shortHash(value: string): string {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(16).padStart(8, '0');
+}
+
 /**
  * Calculate days since a date
  */
@@ -43,6 +43,7 @@ export {
   formatSalary,
   formatNumber,
   cleanHtmlText,
+  scanClassText,
   filterJobsByAge,
   parsePortugueseDate,
   extractSalaryFromText,
@@ -50,6 +51,7 @@ export {
   detectJobType,
   sortJobs,
   generateJobHash,
+  shortHash,
   daysSince,
 } from './helpers';
 
@@ -20,42 +20,38 @@ export interface PortalScanResult {
 
 // ─── Portal Type Detection ───────────────────────────────────────────────────
 
+// One pass over the URL for every supported ATS host; the capture group that
+// matched identifies the portal type and holds its board slug:
+// 1 greenhouse, 2 ashby, 3 ashby posting API, 4 lever.
+const PORTAL_URL_RE =
+  /boards\.greenhouse\.io\/([^/?#]+)|jobs\.ashbyhq\.com\/([^/?#]+)|api\.ashbyhq\.com\/posting-api\/job-board\/([^/?#]+)|jobs\.lever\.co\/([^/?#]+)/;
+
 export function detectPortalType(careersUrl: string): {
   type: 'greenhouse' | 'ashby' | 'lever' | 'custom';
   slug: string | null;
 } {
-  const url = careersUrl.toLowerCase();
-
-  const greenhouse = url.match(/boards\.greenhouse\.io\/([^/?#]+)/);
-  if (greenhouse) return { type: 'greenhouse', slug: greenhouse[1] };
-
-  const ashby1 = url.match(/jobs\.ashbyhq\.com\/([^/?#]+)/);
-  if (ashby1) return { type: 'ashby', slug: ashby1[1] };
-
-  const ashby2 = url.match(/api\.ashbyhq\.com\/posting-api\/job-board\/([^/?#]+)/);
-  if (ashby2) return { type: 'ashby', slug: ashby2[1] };
+  const m = careersUrl.toLowerCase().match(PORTAL_URL_RE);
+  if (!m) return { type: 'custom', slug: null };
 
-  const lever = url.match(/jobs\.lever\.co\/([^/?#]+)/);
-  if (lever) return { type: 'lever', slug: lever[1] };
-
-  return { type: 'custom', slug: null };
+  if (m[1]) return { type: 'greenhouse', slug: m[1] };
+  if (m[2]) return { type: 'ashby', slug: m[2] };
+  if (m[3]) return { type: 'ashby', slug: m[3] };
+  return { type: 'lever', slug: m[4] };
 }
 
 // ─── Title Filtering ─────────────────────────────────────────────────────────
 
 function applyTitleFilters(jobs: JobListing[], filters: TitleFilters): JobListing[] {
+  // Lowercase the keywords once per scan rather than once per job
+  const include = filters.include.map((kw) => kw.toLowerCase());
+  const exclude = filters.exclude.map((kw) => kw.toLowerCase());
+  if (include.length === 0 && exclude.length === 0) return jobs;
+
   return jobs.filter((job) => {
     const title = job.title.toLowerCase();
 
-    if (filters.include.length > 0) {
-      const hasInclude = filters.include.some((kw) => title.includes(kw.toLowerCase()));
-      if (!hasInclude) return false;
-    }
-
-    if (filters.exclude.length > 0) {
-      const hasExclude = filters.exclude.some((kw) => title.includes(kw.toLowerCase()));
-      if (hasExclude) return false;
-    }
+    if (include.length > 0 && !include.some((kw) => title.includes(kw))) return false;
+    if (exclude.length > 0 && exclude.some((kw) => title.includes(kw))) return false;
 
     return true;
   });
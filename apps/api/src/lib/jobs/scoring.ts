@@ -35,8 +35,8 @@ const SCORING_WEIGHTS = {
   titleMatch: 5,
 };
 
-const RELIABLE_SOURCES = ['linkedin', 'remoteok', 'remotive'];
-const MODERATE_SOURCES = ['adzuna', 'arbeitnow', 'jsearch'];
+const RELIABLE_SOURCES = new Set<string>(['linkedin', 'remoteok', 'remotive']);
+const MODERATE_SOURCES = new Set<string>(['adzuna', 'arbeitnow', 'jsearch']);
 
 /**
  * Calculate base relevance score for a job listing
@@ -45,9 +45,9 @@ export function calculateBaseScore(job: JobListing): number {
   let score = 0;
 
   // Source reliability
-  if (RELIABLE_SOURCES.includes(job.source)) {
+  if (RELIABLE_SOURCES.has(job.source)) {
     score += SCORING_WEIGHTS.reliableSource;
-  } else if (MODERATE_SOURCES.includes(job.source)) {
+  } else if (MODERATE_SOURCES.has(job.source)) {
     score += SCORING_WEIGHTS.moderateSource;
   } else {
     score += SCORING_WEIGHTS.unknownSource;
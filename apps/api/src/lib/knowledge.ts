@@ -95,9 +95,14 @@ function validateExtractedItems(value: unknown): ExtractedKnowledgeItem[] {
     .slice(0, 40);
 }
 
+const JSON_FENCE_RE = /```(?:json)?\s*([\s\S]*?)```/i;
+const JSON_OBJECT_RE = /\{[\s\S]*\}/;
+const JSON_ARRAY_RE = /\[[\s\S]*\]/;
+
 function extractJson(content: string): unknown {
-  const fenced = content.match(/```(?:json)?\s*([\s\S]*?)```/i);
-  const jsonText = fenced?.[1] || content.match(/\{[\s\S]*\}/)?.[0] || content.match(/\[[\s\S]*\]/)?.[0];
+  // Most responses are bare JSON; only run the fence regex when a fence exists
+  const fenced = content.includes('```') ? content.match(JSON_FENCE_RE) : null;
+  const jsonText = fenced?.[1] || content.match(JSON_OBJECT_RE)?.[0] || content.match(JSON_ARRAY_RE)?.[0];
   if (!jsonText) {
     throw new Error('AI response did not include JSON');
   }
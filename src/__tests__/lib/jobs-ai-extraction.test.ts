@@ -0,0 +1,45 @@
+// @vitest-environment node
+import { describe, it, expect, vi } from 'vitest';
+
+vi.mock('../../../apps/api/src/lib/ai-tracking', () => ({
+  trackAIUsage: vi.fn(),
+  estimateTokens: vi.fn(),
+  checkQuotaLimits: vi.fn(),
+}));
+
+import { trimForContext } from '../../../apps/api/src/lib/jobs/ai-extraction';
+
+const BUDGET = 15_000;
+
+describe('trimForContext', () => {
+  it('keeps the top of the page when no job container is found', () => {
+    const html = '<p>' + 'a'.repeat(19_990) + '</p>';
+    expect(trimForContext(html)).toBe(html.slice(0, BUDGET));
+  });
+
+  it('starts the window at an early job container', () => {
+    const html =
+      '<nav class="menu">' + 'x'.repeat(2_000) + '</nav>' +
+      '<ul class="job-list">' + 'y'.repeat(20_000) + '</ul>';
+
+    const result = trimForContext(html);
+
+    expect(result.startsWith('<ul class="job-list">')).toBe(true);
+    expect(result).toHaveLength(BUDGET);
+  });
+
+  it('pulls a late match back so the window stays full', () => {
+    const html =
+      '<div class="card">' + 'a'.repeat(20_000) + '</div>' +
+      '<footer class="footer-jobs">links</footer>';
+
+    expect(trimForContext(html)).toBe(html.slice(-BUDGET));
+  });
+
+  it('drops a tag left half-open by the cut', () => {
+    const text = '<p>' + 'a'.repeat(14_992);
+    const html = text + '<span class="x">b</span>' + 'c'.repeat(1_000);
+
+    expect(trimForContext(html)).toBe(text);
+  });
+});
@@ -0,0 +1,49 @@
+// @vitest-environment node
+import { describe, it, expect, beforeEach } from 'vitest';
+import {
+  getCachedResults,
+  setCachedResults,
+  clearCache,
+  getCacheStats,
+} from '../../../apps/api/src/lib/jobs/cache';
+import type { JobListing } from '../../../apps/api/src/lib/jobs/types';
+
+const job: JobListing = {
+  id: 'j1',
+  source: 'remoteok',
+  title: 'Node Developer',
+  company: 'Acme',
+  description: '',
+  url: 'https://example.com/j1',
+};
+
+describe('job search cache', () => {
+  beforeEach(() => {
+    clearCache();
+  });
+
+  it('returns stored results for the same params', () => {
+    setCachedResults({ keyword: 'node' }, ['all'], [job]);
+    expect(getCachedResults({ keyword: 'node' }, ['all'])).toEqual([job]);
+    expect(getCachedResults({ keyword: 'react' }, ['all'])).toBeNull();
+  });
+
+  it('expires entries after their ttl', () => {
+    setCachedResults({ keyword: 'node' }, ['all'], [job], -1);
+    expect(getCachedResults({ keyword: 'node' }, ['all'])).toBeNull();
+  });
+
+  it('evicts the least recently used search once full', () => {
+    for (let i = 0; i < 200; i++) {
+      setCachedResults({ keyword: `kw${i}` }, ['all'], [job]);
+    }
+    // Touch the oldest entry so kw1 becomes the eviction candidate
+    expect(getCachedResults({ keyword: 'kw0' }, ['all'])).not.toBeNull();
+
+    setCachedResults({ keyword: 'overflow' }, ['all'], [job]);
+
+    expect(getCacheStats().entries).toBe(200);
+    expect(getCachedResults({ keyword: 'kw0' }, ['all'])).not.toBeNull();
+    expect(getCachedResults({ keyword: 'kw1' }, ['all'])).toBeNull();
+  });
+});
@@ -0,0 +1,40 @@
+// @vitest-environment node
+import { describe, it, expect } from 'vitest';
+import { deduplicateJobsAdvanced } from '../../../apps/api/src/lib/jobs/deduplication';
+import type { JobListing } from '../../../apps/api/src/lib/jobs/types';
+
+function makeJob(id: string, title: string, company: string, extra: Partial<JobListing> = {}): JobListing {
+  return {
+    id,
+    source: 'remoteok',
+    title,
+    company,
+    description: '',
+    url: `https://example.com/${id}`,
+    ...extra,
+  };
+}
+
+describe('deduplicateJobsAdvanced', () => {
+  it('collapses near-identical listings into the most complete one', () => {
+    const jobs = [
+      makeJob('a', 'Senior Node.js Developer', 'Acme'),
+      makeJob('b', 'Senior NodeJS Developer', 'Acme', { salary: '$100k', location: 'Remote' }),
+    ];
+
+    const result = deduplicateJobsAdvanced(jobs);
+
+    expect(result).toHaveLength(1);
+    expect(result[0].id).toBe('b');
+  });
+
+  it('keeps distinct listings apart', () => {
+    const jobs = [
+      makeJob('a', 'Senior Node.js Developer', 'Acme'),
+      makeJob('b', 'Product Designer', 'Globex'),
+      makeJob('c', 'QA', 'X'),
+    ];
+
+    expect(deduplicateJobsAdvanced(jobs).map((j) => j.id)).toEqual(['a', 'b', 'c']);
+  });
+});
@@ -0,0 +1,52 @@
+// @vitest-environment node
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { searchProgramathor } from '../../../apps/api/src/lib/jobs/apis/programathor';
+
+const originalFetch = global.fetch;
+
+function servePage(html: string) {
+  global.fetch = vi.fn(async () => new Response(html, { status: 200 })) as typeof fetch;
+}
+
+describe('searchProgramathor', () => {
+  afterEach(() => {
+    global.fetch = originalFetch;
+  });
+
+  it('keeps a card whose href was first seen on a title-less fragment', async () => {
+    servePage(
+      '<ul>' +
+        '<li data-id="1"><a href="/jobs-tech/123"><img src="logo.png"></a></li>' +
+        '<li data-id="2"><a href="/jobs-tech/123"><h3>Node Developer</h3></a><span class="company">Acme</span></li>' +
+        '<li data-id="3"><a href="/jobs-tech/123"><h3>Node Developer</h3></a></li>' +
+      '</ul>'
+    );
+
+    const jobs = await searchProgramathor({ keyword: 'node' });
+
+    expect(jobs).toHaveLength(1);
+    expect(jobs[0]).toMatchObject({
+      id: 'programathor-2',
+      title: 'Node Developer',
+      company: 'Acme',
+      url: 'https://programathor.com.br/jobs-tech/123',
+    });
+  });
+
+  it('falls back to heading links, deduplicated by href', async () => {
+    servePage(
+      '<div>' +
+        '<a href="/jobs-tech/1-dev"><h2>Dev A</h2></a>' +
+        '<a href="/jobs-tech/1-dev"><h2>Dev A</h2></a>' +
+        '<a href="/jobs-tech/2-qa"> <h3>QA &amp; Test</h3></a>' +
+      '</div>'
+    );
+
+    const jobs = await searchProgramathor({});
+
+    expect(jobs.map((j) => [j.title, j.url])).toEqual([
+      ['Dev A', 'https://programathor.com.br/jobs-tech/1-dev'],
+      ['QA & Test', 'https://programathor.com.br/jobs-tech/2-qa'],
+    ]);
+  });
+});
@@ -0,0 +1,68 @@
+// @vitest-environment node
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+vi.hoisted(() => {
+  process.env.PYTHON_SCRAPER_URL = 'http://scraper.test';
+});
+vi.mock('../../../apps/api/src/lib/logger', () => ({
+  logger: { info: vi.fn(), warn: vi.fn(), error: vi.fn(), debug: vi.fn() },
+}));
+
+const originalFetch = global.fetch;
+const fetchMock = vi.fn();
+
+// The health cache is module state, so load a fresh copy per test
+async function loadScraper() {
+  vi.resetModules();
+  return import('../../../apps/api/src/lib/jobs/apis/python-scraper');
+}
+
+describe('isPythonScraperAvailable', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    fetchMock.mockReset();
+    global.fetch = fetchMock as unknown as typeof fetch;
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    global.fetch = originalFetch;
+  });
+
+  it('shares one /health request between concurrent callers', async () => {
+    fetchMock.mockResolvedValue(new Response('ok', { status: 200 }));
+    const { isPythonScraperAvailable } = await loadScraper();
+
+    const results = await Promise.all([isPythonScraperAvailable(), isPythonScraperAvailable()]);
+
+    expect(results).toEqual([true, true]);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('reuses a probe result within the 30s TTL', async () => {
+    fetchMock.mockResolvedValue(new Response('ok', { status: 200 }));
+    const { isPythonScraperAvailable } = await loadScraper();
+
+    expect(await isPythonScraperAvailable()).toBe(true);
+    vi.advanceTimersByTime(29_000);
+    expect(await isPythonScraperAvailable()).toBe(true);
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock).toHaveBeenCalledWith('http://scraper.test/health', expect.anything());
+  });
+
+  it('caches a failed probe as unavailable and re-probes after the TTL', async () => {
+    fetchMock.mockRejectedValueOnce(new Error('ECONNREFUSED'));
+    const { isPythonScraperAvailable } = await loadScraper();
+
+    expect(await isPythonScraperAvailable()).toBe(false);
+    expect(await isPythonScraperAvailable()).toBe(false);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    fetchMock.mockResolvedValueOnce(new Response('ok', { status: 200 }));
+    vi.advanceTimersByTime(30_001);
+
+    expect(await isPythonScraperAvailable()).toBe(true);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
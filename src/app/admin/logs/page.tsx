@@ -180,6 +180,7 @@ export default function LogsPage() {
     'jooble',
     'jsearch',
     'netempregos',
+    'buscojobs',
     'linkedin',
     'ai-extraction',
     'api',
@@ -16,6 +16,7 @@ export type LogSource =
   | 'jooble'
   | 'jsearch'
   | 'netempregos'
+  | 'buscojobs'
   | 'linkedin'
   | 'ai-extraction'
   | 'job-enrichment'